@@ -3,16 +3,28 @@ Generate a large-scale synthetic call center transcript dataset
 Simulates 500k calls/day worth of conversations
 """
 
-import json
 import random
+import re
 import os
+import shutil
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
 
+import numpy as np
+import orjson
+
 # Configuration for 500k calls/day simulation
 TOTAL_CONVERSATIONS = 92000  # Use full dataset size
 UTTERANCES_PER_CONVERSATION_MIN = 8
 UTTERANCES_PER_CONVERSATION_MAX = 25
 OUTPUT_FILE = "data/conversations.jsonl"
+NUM_WORKERS = os.cpu_count() or 1
+RANDOM_BLOCK_SIZE = 65536  # Per-utterance random values drawn per numpy call
+WRITE_BATCH_RECORDS = 256  # Serialized utterances gathered per write syscall (below IOV_MAX)
+
+DOMAINS = ['billing', 'technical_support', 'sales', 'customer_service']
+TOPICS = ['inbound', 'outbound']
+ACCENTS = ['american', 'british', 'indian', 'filipino', 'australian']
 
 # Conversation templates
 TEMPLATES = [
@@ -160,95 +172,210 @@ REPLACEMENTS = {
     ]),
 }
 
-def fill_template(template_text):
-    """Fill in template placeholders with random values"""
-    result = template_text
-    for key, value_func in REPLACEMENTS.items():
-        placeholder = "{" + key + "}"
-        if placeholder in result:
-            result = result.replace(placeholder, value_func())
-    return result
+_PLACEHOLDER_RE = re.compile(r"\{(\w+)\}")
+
+
+def compile_template(text):
+    """Split template text into its literal chunks and the placeholder keys between them"""
+    segments = _PLACEHOLDER_RE.split(text)
+    return tuple(segments[0::2]), tuple(segments[1::2])
+
+
+# Templates parsed once at import as (speaker, literal_chunks, placeholder_keys)
+COMPILED_TEMPLATES = [
+    [(speaker, *compile_template(text)) for speaker, text in template]
+    for template in TEMPLATES
+]
+
+CUSTOMER_FILLERS = [
+    ("customer", (text,), ())
+    for text in ["I see.", "Okay, got it.", "Understood.", "That makes sense.", "Alright."]
+]
+
+AGENT_FILLERS = [
+    ("agent", (text,), ())
+    for text in [
+        "Let me check on that for you.",
+        "One moment please.",
+        "I'm looking into that now.",
+        "Give me just a second.",
+    ]
+]
+
+
+# Word counts are taken as spaces + 1, which relies on single-spaced template text
+assert all(
+    text == " ".join(text.split())
+    for text in [text for template in TEMPLATES for _, text in template]
+    + [literals[0] for _, literals, _ in CUSTOMER_FILLERS + AGENT_FILLERS]
+), "templates must not contain leading, trailing or repeated whitespace"
+
+
+def fill_template(literals, keys, _replacements=REPLACEMENTS):
+    """Assemble a precompiled template, drawing a random value for each placeholder"""
+    if not keys:
+        return literals[0]
+    parts = [literals[0]]
+    for key, literal in zip(keys, literals[1:]):
+        parts.append(_replacements[key]())
+        parts.append(literal)
+    return "".join(parts)
+
+
+class RandomPool:
+    """Per-utterance random values drawn in bulk with numpy and consumed in order"""
+
+    def __init__(self, rng, block_size=RANDOM_BLOCK_SIZE):
+        self.rng = rng
+        self.block_size = block_size
+        self._refill()
+
+    def _refill(self):
+        n = self.block_size
+        self.speed = self.rng.uniform(0.4, 0.6, n).tolist()  # Seconds per word
+        self.pause = self.rng.uniform(0.2, 1.5, n).tolist()  # Seconds between utterances
+        self.confidence = self.rng.uniform(0.92, 1.0, n).tolist()  # 92-100% confidence
+        self.domain = self._choice(DOMAINS, n)
+        self.topic = self._choice(TOPICS, n)
+        self.accent = self._choice(ACCENTS, n)
+        self.pos = 0
+
+    def _choice(self, options, n):
+        """Draw n values uniformly from a small list of strings"""
+        return np.array(options, dtype=object)[self.rng.integers(0, len(options), n)].tolist()
+
+    def take(self, count):
+        """Reserve `count` consecutive values and return the index of the first one"""
+        if self.pos + count > self.block_size:
+            self._refill()
+        start = self.pos
+        self.pos += count
+        return start
 
-def generate_conversation(conv_id):
-    """Generate a single conversation"""
-    template = random.choice(TEMPLATES)
+
+def generate_conversation(conv_id, pool, _choice=random.choice, _random=random.random,
+                          _randint=random.randint, _dumps=orjson.dumps, _fill=fill_template):
+    """Generate a single conversation as serialized JSON lines, one per utterance"""
+    # Hot-path callables are bound as defaults to skip global and attribute lookups
+    template = _choice(COMPILED_TEMPLATES)
 
     # Add some variation by randomly repeating or removing utterances
-    if random.random() < 0.3:  # 30% chance to extend conversation
+    if _random() < 0.3:  # 30% chance to extend conversation
         # Duplicate some utterances with variations
         extended_template = list(template)
-        num_extensions = random.randint(1, 5)
+        num_extensions = _randint(1, 5)
         for _ in range(num_extensions):
-            idx = random.randint(1, len(template) - 2)
+            idx = _randint(1, len(template) - 2)
             speaker = template[idx][0]
-            if speaker == "customer":
-                extended_template.insert(idx + 1, (speaker, random.choice([
-                    "I see.",
-                    "Okay, got it.",
-                    "Understood.",
-                    "That makes sense.",
-                    "Alright."
-                ])))
-            else:
-                extended_template.insert(idx + 1, (speaker, random.choice([
-                    "Let me check on that for you.",
-                    "One moment please.",
-                    "I'm looking into that now.",
-                    "Give me just a second.",
-                ])))
+            fillers = CUSTOMER_FILLERS if speaker == "customer" else AGENT_FILLERS
+            extended_template.insert(idx + 1, _choice(fillers))
         template = extended_template
 
-    utterances = []
+    lines = []
     current_time = 0.0
+    base = pool.take(len(template))
+    speed, pause, confidence = pool.speed, pool.pause, pool.confidence
+    domain, topic, accent = pool.domain, pool.topic, pool.accent
+
+    # Every field except text is a known-safe literal, so lines are formatted directly
+    # in schema order rather than building and serializing a dict per utterance
+    prefix = f'{{"conversation_id":"{conv_id}","utterance_id":'
+
+    for idx, (speaker, literals, keys) in enumerate(template):
+        text = _fill(literals, keys)
+        word_count = text.count(' ') + 1
+        duration = word_count * speed[base + idx]  # Vary speaking speed
 
-    domains = ['billing', 'technical_support', 'sales', 'customer_service']
-    topics = ['inbound', 'outbound']
-    accents = ['american', 'british', 'indian', 'filipino', 'australian']
-
-    for idx, (speaker, text_template) in enumerate(template):
-        text = fill_template(text_template)
-        word_count = len(text.split())
-        duration = word_count * random.uniform(0.4, 0.6)  # Vary speaking speed
-
-        utterances.append({
-            "conversation_id": conv_id,
-            "utterance_id": idx,
-            "speaker": speaker,
-            "text": text,
-            "confidence": round(0.92 + random.random() * 0.08, 4),  # 92-100% confidence
-            "start_time": round(current_time, 2),
-            "end_time": round(current_time + duration, 2),
-            "domain": random.choice(domains),
-            "topic": random.choice(topics),
-            "accent": random.choice(accents),
-        })
+        lines.append((
+            f'{prefix}{idx},"speaker":"{speaker}","text":{_dumps(text).decode()}'
+            f',"confidence":{confidence[base + idx]:.4f}'
+            f',"start_time":{current_time:.2f},"end_time":{current_time + duration:.2f}'
+            f',"domain":"{domain[base + idx]}","topic":"{topic[base + idx]}","accent":"{accent[base + idx]}"}}\n'
+        ).encode())
 
         # Add natural pause between utterances
-        current_time += duration + random.uniform(0.2, 1.5)
+        current_time += duration + pause[base + idx]
+
+    return lines
+
+
+def _write_records(fd, records):
+    """Write serialized records to a file descriptor, gathering them into one syscall where supported"""
+    if hasattr(os, 'writev'):
+        written = os.writev(fd, records)
+        total = sum(map(len, records))
+        if written == total:
+            return
+        data = memoryview(b"".join(records))[written:]  # Finish a short write
+    else:
+        data = memoryview(b"".join(records))
+    while data:
+        data = data[os.write(fd, data):]
+
+
+def _generate_shard(shard_id, start, end, seed, path):
+    """Generate conversations [start, end) into a shard file, returning the utterance count"""
+    random.seed(seed + shard_id)
+    pool = RandomPool(np.random.default_rng(seed + shard_id))
+
+    shard_utterances = 0
+    records = []
+
+    with open(path, 'wb', buffering=0) as f:
+        fd = f.fileno()
+        for i in range(start, end):
+            conv_id = f"conv_{i:06d}"
+            lines = generate_conversation(conv_id, pool)
+
+            # Write the serialized utterances in batches of records
+            records.extend(lines)
+            shard_utterances += len(lines)
+
+            if len(records) >= WRITE_BATCH_RECORDS:
+                _write_records(fd, records)
+                records.clear()
+
+        if records:
+            _write_records(fd, records)
+
+    return shard_utterances
 
-    return utterances
 
-def generate_dataset():
-    """Generate the full dataset"""
-    print(f"Generating {TOTAL_CONVERSATIONS:,} conversations...")
+def generate_dataset(num_workers=NUM_WORKERS, seed=None):
+    """Generate the full dataset, sharding conversations across worker processes"""
+    print(f"Generating {TOTAL_CONVERSATIONS:,} conversations on {num_workers} workers...")
 
     # Create output directory
     Path("data").mkdir(exist_ok=True)
 
-    total_utterances = 0
+    if seed is None:
+        seed = random.randrange(2 ** 32)
 
-    with open(OUTPUT_FILE, 'w') as f:
-        for i in range(TOTAL_CONVERSATIONS):
-            conv_id = f"conv_{i:06d}"
-            utterances = generate_conversation(conv_id)
+    # Conversations are independent, so each shard only needs its own seed
+    shard_size = -(-TOTAL_CONVERSATIONS // num_workers)
+    shards = [
+        (shard_id, start, min(start + shard_size, TOTAL_CONVERSATIONS), f"data/shard_{shard_id}.jsonl")
+        for shard_id, start in enumerate(range(0, TOTAL_CONVERSATIONS, shard_size))
+    ]
 
-            # Write each utterance as a JSON line
-            for utterance in utterances:
-                f.write(json.dumps(utterance) + '\n')
-                total_utterances += 1
+    total_utterances = 0
 
-            if (i + 1) % 1000 == 0:
-                print(f"Generated {i + 1:,} conversations ({total_utterances:,} utterances)")
+    with ProcessPoolExecutor(max_workers=num_workers) as executor:
+        futures = {
+            executor.submit(_generate_shard, shard_id, start, end, seed, path): (start, end)
+            for shard_id, start, end, path in shards
+        }
+        for future in as_completed(futures):
+            start, end = futures[future]
+            total_utterances += future.result()
+            print(f"Generated conversations {start:,}-{end - 1:,} ({total_utterances:,} utterances so far)")
+
+    # Concatenate shards in conversation order
+    with open(OUTPUT_FILE, 'wb') as out:
+        for _, _, _, path in shards:
+            with open(path, 'rb') as shard:
+                shutil.copyfileobj(shard, out)
+            os.remove(path)
 
     avg_utterances = total_utterances / TOTAL_CONVERSATIONS
     print(f"\nDataset generation complete!")
@@ -260,5 +387,6 @@ def generate_dataset():
     print(f"  Estimated daily utterances: {int(500000 * avg_utterances):,}")
     print(f"  Required throughput: {int(500000 * avg_utterances / 86400)} utterances/second")
 
+
 if __name__ == "__main__":
     generate_dataset()
@@ -14,19 +14,26 @@ Access at:
 
 from fastapi import FastAPI, HTTPException, Query
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import StreamingResponse
-from typing import Optional, List, Dict, Any
+from fastapi.responses import Response, StreamingResponse
+from typing import Optional, List, Dict, Any, Tuple, Iterator
 from datetime import datetime, timezone
 from pydantic import BaseModel, Field
-import json
 import asyncio
+import mmap
+import pickle
+import re
+import threading
+from array import array
+from contextlib import asynccontextmanager
 from enum import Enum
+from functools import lru_cache
 import os
 
 # Import real data source components
 import sys
 import requests
 import time
+import orjson
 from requests.adapters import HTTPAdapter
 from requests.packages.urllib3.util.retry import Retry
 
@@ -123,16 +130,60 @@ REGION_BBOXES = {
     "GLOBAL": BoundingBox(-90.0, 90.0, -180.0, 180.0),
 }
 
+# Ready-to-send query parameters for each region
+REGION_PARAMS = {
+    name: {'lamin': bbox.lamin, 'lamax': bbox.lamax, 'lomin': bbox.lomin, 'lomax': bbox.lomax}
+    for name, bbox in REGION_BBOXES.items()
+}
+
+
+@lru_cache(maxsize=4096)
+def _utc_datetime(timestamp: int) -> datetime:
+    """Convert a Unix timestamp to a UTC datetime, reusing results for repeated seconds"""
+    return datetime.fromtimestamp(timestamp, tz=timezone.utc)
+
+
+class AsyncTokenBucket:
+    """Token bucket rate limiter whose waits suspend the calling coroutine instead of the event loop"""
+
+    def __init__(self, capacity: float, refill_rate: float):
+        self.capacity = capacity
+        self.refill_rate = refill_rate  # tokens per second
+        self.tokens = capacity
+        self.last_refill = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self):
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.last_refill) * self.refill_rate)
+        self.last_refill = now
+
+    async def acquire(self, n: float = 1):
+        """Wait until n tokens are available, then take them"""
+        # Waiters queue on the lock so tokens are handed out in arrival order
+        async with self._lock:
+            self._refill()
+            if self.tokens < n:
+                await asyncio.sleep((n - self.tokens) / self.refill_rate)
+                self._refill()
+            self.tokens -= n
+
 
 class OpenSkyClient:
     """Client for OpenSky Network API"""
 
     MIN_REQUEST_INTERVAL = 5.0  # seconds
     MAX_RETRIES = 3
+    POOL_CONNECTIONS = 20  # Per-host pools kept (API and auth hosts)
+    POOL_MAXSIZE = 50  # Keep-alive connections per host, for bursts from worker threads
+    FLIGHTS_CACHE_TTL = 5.0  # seconds a fetched region is shared with other callers
 
     def __init__(self):
         self.session = self._create_session()
-        self.last_request_time = 0
+        # One request per MIN_REQUEST_INTERVAL, without bursts; endpoints acquire before calling
+        self.rate_limiter = AsyncTokenBucket(capacity=1, refill_rate=1 / self.MIN_REQUEST_INTERVAL)
+        self._flights_cache: Dict[str, Tuple[float, List[Dict[str, Any]]]] = {}
+        self._flights_inflight: Dict[str, asyncio.Task] = {}
         self.client_id = os.environ.get('OPENSKY_CLIENT_ID')
         self.client_secret = os.environ.get('OPENSKY_CLIENT_SECRET')
         self.access_token = None
@@ -146,7 +197,11 @@ class OpenSkyClient:
             backoff_factor=2,
             status_forcelist=[429, 500, 502, 503, 504]
         )
-        adapter = HTTPAdapter(max_retries=retry_strategy)
+        adapter = HTTPAdapter(
+            pool_connections=self.POOL_CONNECTIONS,
+            pool_maxsize=self.POOL_MAXSIZE,
+            max_retries=retry_strategy
+        )
         session.mount("https://", adapter)
         session.mount("http://", adapter)
         return session
@@ -168,7 +223,7 @@ class OpenSkyClient:
         }
 
         try:
-            response = requests.post(token_url, data=data, timeout=10)
+            response = self.session.post(token_url, data=data, timeout=10)
             response.raise_for_status()
             token_data = response.json()
 
@@ -178,32 +233,20 @@ class OpenSkyClient:
         except Exception as e:
             print(f"Failed to get access token: {e}")
 
-    def _handle_rate_limit(self):
-        """Ensure minimum interval between requests"""
-        current_time = time.time()
-        time_since_last = current_time - self.last_request_time
-
-        if time_since_last < self.MIN_REQUEST_INTERVAL:
-            sleep_time = self.MIN_REQUEST_INTERVAL - time_since_last
-            time.sleep(sleep_time)
-
-        self.last_request_time = time.time()
+    def is_available(self) -> bool:
+        """Probe the OpenSky states endpoint, reusing the pooled session"""
+        response = self.session.get(
+            "https://opensky-network.org/api/states/all",
+            timeout=5
+        )
+        return response.status_code == 200
 
     def get_flights(self, region: str = "NORTH_AMERICA") -> List[Dict[str, Any]]:
         """Fetch flights from OpenSky Network API"""
-        self._handle_rate_limit()
-
         if self.client_id and self.client_secret:
             self._get_access_token()
 
-        bbox = REGION_BBOXES.get(region.upper(), REGION_BBOXES["NORTH_AMERICA"])
-
-        params = {
-            'lamin': bbox.lamin,
-            'lamax': bbox.lamax,
-            'lomin': bbox.lomin,
-            'lomax': bbox.lomax
-        }
+        params = REGION_PARAMS.get(region.upper(), REGION_PARAMS["NORTH_AMERICA"])
 
         headers = {}
         if self.access_token:
@@ -217,25 +260,27 @@ class OpenSkyClient:
                 timeout=10
             )
             response.raise_for_status()
-            data = response.json()
+            data = orjson.loads(response.content)
 
             flights = []
             timestamp = data.get('time', int(time.time()))
+            time_ingest = _utc_datetime(timestamp)
 
-            for state in data.get('states', []):
-                if not state or len(state) < 17:
-                    continue
-
-                if state[0] is None or state[5] is None or state[6] is None:
-                    continue
+            # Drop malformed rows and rows missing icao24 or a position in one filtering pass
+            states = [
+                state for state in data.get('states') or []
+                if state and len(state) >= 17
+                and state[0] is not None and state[5] is not None and state[6] is not None
+            ]
 
+            for state in states:
                 flights.append({
-                    "time_ingest": datetime.fromtimestamp(timestamp, tz=timezone.utc),
+                    "time_ingest": time_ingest,
                     "icao24": state[0],
                     "callsign": state[1].strip() if state[1] else None,
                     "origin_country": state[2],
-                    "time_position": datetime.fromtimestamp(state[3], tz=timezone.utc) if state[3] else None,
-                    "last_contact": datetime.fromtimestamp(state[4], tz=timezone.utc) if state[4] else None,
+                    "time_position": _utc_datetime(state[3]) if state[3] else None,
+                    "last_contact": _utc_datetime(state[4]) if state[4] else None,
                     "longitude": float(state[5]) if state[5] is not None else None,
                     "latitude": float(state[6]) if state[6] is not None else None,
                     "geo_altitude": float(state[7]) if state[7] is not None else None,
@@ -250,27 +295,61 @@ class OpenSkyClient:
         except Exception as e:
             raise HTTPException(status_code=503, detail=f"OpenSky API error: {str(e)}")
 
+    async def _fetch_flights(self, region: str) -> List[Dict[str, Any]]:
+        """Fetch one region upstream under the rate limit and cache the result"""
+        try:
+            await self.rate_limiter.acquire()
+            flights = await asyncio.to_thread(self.get_flights, region=region)
+            self._flights_cache[region] = (time.monotonic(), flights)
+            return flights
+        finally:
+            del self._flights_inflight[region]
+
+    async def get_flights_cached(self, region: str = "NORTH_AMERICA") -> List[Dict[str, Any]]:
+        """
+        Get flights for a region, sharing recent and in-flight fetches between callers.
+
+        Results younger than FLIGHTS_CACHE_TTL are returned as-is, and concurrent
+        callers for the same region wait on a single upstream request.
+        """
+        cached = self._flights_cache.get(region)
+        if cached and time.monotonic() - cached[0] < self.FLIGHTS_CACHE_TTL:
+            return cached[1]
+
+        task = self._flights_inflight.get(region)
+        if task is None:
+            task = self._flights_inflight[region] = asyncio.create_task(self._fetch_flights(region))
+        # Shield so one disconnecting client does not cancel the fetch for everyone else
+        return await asyncio.shield(task)
+
 
 # ============================================================================
 # Transcript Integration
 # ============================================================================
 
+CONVERSATION_START_RE = re.compile(rb'"utterance_id": ?0[,}]')
+
+
 class TranscriptClient:
     """Client for call center transcript datasets"""
 
     LOCAL_DATASET_PATH = "data/conversations.jsonl"
+    INDEX_CACHE_PATH = "data/conversations.jsonl.idx"  # Pickled line offsets, rebuilt when stale
     CHUNK_SIZE = 1000  # Load utterances in chunks
+    OFFLOAD_CHUNK_SIZE = 1000  # Chunks at least this large are spliced in a worker thread
 
     def __init__(self):
-        self.conversations = []
+        self._data = b""  # JSONL utterances: read-only mmap of the dataset or in-memory sample bytes
+        self._offsets = array('Q', [0])  # Start offset of each line, followed by the end offset
         self.current_idx = 0
         self.total_utterances = 0
+        self._cursor_lock = threading.Lock()  # Chunks may be read from worker threads
         self._load_dataset()
 
     def _load_dataset(self):
         """Load conversations from local file or use fallback data"""
         # Try to load from local file first (fastest)
-        if os.path.exists(self.LOCAL_DATASET_PATH):
+        if os.path.exists(self.LOCAL_DATASET_PATH) and os.path.getsize(self.LOCAL_DATASET_PATH) > 0:
             print(f"Loading dataset from local file: {self.LOCAL_DATASET_PATH}")
             self._load_from_local_file()
             return
@@ -279,22 +358,68 @@ class TranscriptClient:
         print("No local dataset file found, using sample data")
         self._generate_sample_data()
 
-    def _load_from_local_file(self):
-        """Load all utterances from local JSONL file"""
-        import json
-
-        print("Loading utterances from local dataset...")
-        with open(self.LOCAL_DATASET_PATH, 'r') as f:
-            for line in f:
-                utterance = json.loads(line.strip())
-                self.conversations.append(utterance)
+    def _build_index(self):
+        """Record the byte offset of every JSONL line without parsing any records"""
+        data = self._data
+        offsets = array('Q', [0])
+        pos = data.find(b'\n')
+        while pos != -1:
+            offsets.append(pos + 1)
+            pos = data.find(b'\n', pos + 1)
+        if offsets[-1] < len(data):
+            offsets.append(len(data))  # Last line without a trailing newline
+
+        self._offsets = offsets
+        self.total_utterances = len(offsets) - 1
+
+    def _load_index_cache(self) -> Optional[int]:
+        """Restore the line index saved by a previous start, returning the conversation count"""
+        try:
+            if os.path.getmtime(self.INDEX_CACHE_PATH) < os.path.getmtime(self.LOCAL_DATASET_PATH):
+                return None
+            with open(self.INDEX_CACHE_PATH, 'rb') as f:
+                cache = pickle.load(f)
+
+            # Only trust a cache in our own format that still describes the mapped file byte for byte
+            offsets = cache["offsets"]
+            num_conversations = cache["num_conversations"]
+            if not isinstance(offsets, array) or offsets.typecode != 'Q' or not isinstance(num_conversations, int):
+                return None
+            if len(offsets) < 2 or offsets[-1] != len(self._data):
+                return None
+        except Exception:
+            return None
+
+        self._offsets = offsets
+        self.total_utterances = len(offsets) - 1
+        return num_conversations
+
+    def _save_index_cache(self, num_conversations: int):
+        """Persist the line index next to the dataset so later starts skip the scan"""
+        try:
+            with open(self.INDEX_CACHE_PATH, 'wb') as f:
+                pickle.dump({"offsets": self._offsets, "num_conversations": num_conversations}, f, protocol=5)
+        except OSError as e:
+            print(f"Could not write index cache {self.INDEX_CACHE_PATH}: {e}")
 
-        self.total_utterances = len(self.conversations)
+    def _load_from_local_file(self):
+        """Memory-map the local JSONL file and index its utterances"""
+        with open(self.LOCAL_DATASET_PATH, 'rb') as f:
+            self._data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        num_conversations = self._load_index_cache()
+        if num_conversations is None:
+            print("Indexing utterances in local dataset...")
+            self._build_index()
+            # Count conversations from the first utterance of each one
+            num_conversations = len(CONVERSATION_START_RE.findall(self._data))
+            self._save_index_cache(num_conversations)
+        else:
+            print(f"Using cached index: {self.INDEX_CACHE_PATH}")
         print(f"Loaded {self.total_utterances:,} utterances from local dataset")
 
         # Calculate average conversation length
-        conv_ids = set(u['conversation_id'] for u in self.conversations)
-        avg_utterances = self.total_utterances / len(conv_ids)
+        avg_utterances = self.total_utterances / max(num_conversations, 1)
         print(f"Average utterances per conversation: {avg_utterances:.1f}")
         print(f"For 500k calls/day: ~{int(500000 * avg_utterances / 86400)} utterances/second needed")
 
@@ -324,17 +449,20 @@ class TranscriptClient:
                 ("agent", "Can you check the lights on your modem?"),
             ],
         ]
+        # Utterance durations depend only on the fixed text, so derive them once per line
+        templates = [
+            [(speaker, text, len(text.split()) * 0.5) for speaker, text in template]
+            for template in templates
+        ]
 
+        conversations = []
         for i in range(50):
             template = random.choice(templates)
             conv_id = f"conv_{i:05d}"
             current_time = 0.0
 
-            for idx, (speaker, text) in enumerate(template):
-                word_count = len(text.split())
-                duration = word_count * 0.5
-
-                self.conversations.append({
+            for idx, (speaker, text, duration) in enumerate(template):
+                conversations.append({
                     "conversation_id": conv_id,
                     "utterance_id": idx,
                     "speaker": speaker,
@@ -349,36 +477,171 @@ class TranscriptClient:
 
                 current_time += duration + random.uniform(0.3, 1.0)
 
-        print(f"Generated {len(self.conversations)} sample utterances")
+        self._data = b"".join(orjson.dumps(utt) + b"\n" for utt in conversations)
+        self._build_index()
+        print(f"Generated {self.total_utterances} sample utterances")
+
+    def get_utterances_json(
+        self,
+        limit: int = 10,
+        timestamp: Optional[bytes] = None,
+        offset: Optional[int] = None
+    ) -> Tuple[bytes, int]:
+        """
+        Get next batch of utterances as a JSON array, all stamped with one shared timestamp.
+
+        The dataset is read as a ring buffer, so a batch that runs past the last
+        utterance continues from the first one. Pass an already-encoded ISO timestamp
+        to reuse the caller's; otherwise the current time is taken. Pass an offset to
+        read from that absolute position (wrapped to the dataset size) without moving
+        the shared cursor, so the same offset always returns the same utterances.
+        Returns the array and its length.
+        """
+        # Claim utterances from the shared cursor (or read at the given offset),
+        # wrapping around the end of the dataset
+        count = min(limit, self.total_utterances)
+        if count <= 0:
+            return b"[]", 0
+        if offset is None:
+            with self._cursor_lock:
+                start_idx = self.current_idx
+                end_idx = start_idx + count
+                self.current_idx = end_idx % self.total_utterances
+        else:
+            start_idx = offset % self.total_utterances
+            end_idx = start_idx + count
+
+        if end_idx <= self.total_utterances:
+            chunk = self._data[self._offsets[start_idx]:self._offsets[end_idx]]
+        else:
+            end_idx -= self.total_utterances
+            tail = self._data[self._offsets[start_idx]:self._offsets[-1]]
+            if not tail.endswith(b"\n"):
+                tail += b"\n"
+            chunk = tail + self._data[:self._offsets[end_idx]]
+
+        # Splice the pre-encoded timestamp field into every serialized record in one pass;
+        # JSON strings cannot hold raw newlines, so each b"\n{" is a record boundary
+        if timestamp is None:
+            timestamp = datetime.now(timezone.utc).isoformat().encode()
+        prefix = b'{"timestamp":"' + timestamp + b'",'
+        body = prefix + chunk.rstrip(b"\n")[1:].replace(b"\n{", b"," + prefix)
+
+        return b"[" + body + b"]", count
 
     def get_utterances(self, limit: int = 10) -> List[Dict[str, Any]]:
         """Get next batch of utterances with timestamp"""
-        if not self.conversations:
-            return []
+        utterances_json, _ = self.get_utterances_json(limit)
+        return orjson.loads(utterances_json)
+
+    def get_utterances_chunk(self, chunk_size: int = 1000, timestamp: Optional[bytes] = None) -> Tuple[bytes, int]:
+        """Get a large chunk of utterances as pre-serialized JSON for high-throughput scenarios"""
+        return self.get_utterances_json(limit=chunk_size, timestamp=timestamp)
+
+    def iter_utterances(self, total: int, chunk_size: int = 1000) -> Iterator[Tuple[bytes, int]]:
+        """Yield pre-serialized chunks (and their lengths) until total utterances have been read"""
+        remaining = total
+        while remaining > 0:
+            utterances_json, count = self.get_utterances_json(limit=min(chunk_size, remaining))
+            if not count:
+                return
+            remaining -= count
+            yield utterances_json, count
+
+    async def get_utterances_chunk_async(self, chunk_size: int = 1000, timestamp: Optional[bytes] = None) -> Tuple[bytes, int]:
+        """Get a chunk like get_utterances_chunk, splicing large ones in a worker thread to keep the event loop responsive"""
+        if chunk_size >= self.OFFLOAD_CHUNK_SIZE:
+            return await asyncio.to_thread(self.get_utterances_json, limit=chunk_size, timestamp=timestamp)
+        return self.get_utterances_json(limit=chunk_size, timestamp=timestamp)
+
+
+class TranscriptBroadcaster:
+    """
+    Fan out transcript chunks from one producer task per (chunk_size, chunk_delay) to every subscriber.
 
-        # Get utterances from current position
-        end_idx = min(self.current_idx + limit, len(self.conversations))
-        utterances = self.conversations[self.current_idx:end_idx]
+    Each subscriber reads from its own bounded queue. The producer waits while every
+    queue is full, so it runs no faster than its fastest subscriber reads. A subscriber
+    that falls behind the others skips chunks, and the next chunk it receives reports
+    how many utterances it missed.
+    """
 
-        # Add current timestamp to each utterance
-        current_time = datetime.now(timezone.utc)
-        result = []
-        for utt in utterances:
-            # Create a copy to avoid modifying the original
-            utt_copy = utt.copy()
-            utt_copy["timestamp"] = current_time
-            result.append(utt_copy)
+    QUEUE_SIZE = 16  # Chunks buffered per subscriber
 
-        # Update position and loop if needed
-        self.current_idx = end_idx
-        if self.current_idx >= len(self.conversations):
-            self.current_idx = 0
+    def __init__(self, client: TranscriptClient):
+        self.client = client
+        # Per key: each subscriber queue mapped to the utterances it has skipped since its last chunk
+        self._subscribers: Dict[Tuple[int, float], Dict[asyncio.Queue, int]] = {}
+        self._producers: Dict[Tuple[int, float], asyncio.Task] = {}
+        self._room: Dict[Tuple[int, float], asyncio.Event] = {}  # Set when a subscriber takes a chunk or leaves
 
-        return result
+    async def _produce(self, key: Tuple[int, float]):
+        """Read chunks from the client and offer each one to all current subscribers"""
+        chunk_size, chunk_delay = key
+        subscribers = self._subscribers[key]
+        room = self._room[key]
+        try:
+            while subscribers:
+                # Read nothing from the dataset until at least one subscriber can take it
+                while subscribers and all(queue.full() for queue in subscribers):
+                    room.clear()
+                    await room.wait()
+                if not subscribers:
+                    break
+
+                timestamp = datetime.now(timezone.utc).isoformat().encode()
+                utterances_json, count = await self.client.get_utterances_chunk_async(
+                    chunk_size=chunk_size, timestamp=timestamp
+                )
+                if count:
+                    for queue, dropped in subscribers.items():
+                        if queue.full():
+                            subscribers[queue] = dropped + count
+                        else:
+                            queue.put_nowait((timestamp, utterances_json, count, dropped))
+                            subscribers[queue] = 0
+
+                # Always yield to the event loop, even with chunk_delay=0, so subscribers can drain
+                await asyncio.sleep(chunk_delay)
+        except Exception as e:
+            # Hand the failure to every subscriber so their streams end instead of waiting forever
+            print(f"Transcript producer {key} failed: {e}")
+            for queue in subscribers:
+                if queue.full():
+                    queue.get_nowait()
+                queue.put_nowait(e)
+        finally:
+            del self._subscribers[key]
+            del self._producers[key]
+            del self._room[key]
+
+    @asynccontextmanager
+    async def subscribe(self, chunk_size: int, chunk_delay: float):
+        """
+        Subscribe for the duration of the block, yielding a coroutine function that returns the next chunk.
+
+        Chunks are (timestamp, utterances_json, count, dropped) tuples, where dropped is
+        the number of utterances skipped since the previous chunk because this subscriber
+        fell behind. If the producer fails, its exception is returned in place of a chunk
+        and no more chunks follow.
+        """
+        key = (chunk_size, chunk_delay)
+        queue = asyncio.Queue(maxsize=self.QUEUE_SIZE)
+        self._subscribers.setdefault(key, {})[queue] = 0
+        room = self._room.setdefault(key, asyncio.Event())
+        if key not in self._producers:
+            self._producers[key] = asyncio.create_task(self._produce(key))
+
+        async def receive():
+            chunk = await queue.get()
+            room.set()
+            return chunk
 
-    def get_utterances_chunk(self, chunk_size: int = 1000) -> List[Dict[str, Any]]:
-        """Get a large chunk of utterances for high-throughput scenarios"""
-        return self.get_utterances(limit=chunk_size)
+        try:
+            yield receive
+        finally:
+            # The producer exits on its next pass once its last subscriber is gone
+            self._subscribers.get(key, {}).pop(queue, None)
+            room.set()
 
 
 # ============================================================================
@@ -387,6 +650,55 @@ class TranscriptClient:
 
 opensky_client = OpenSkyClient()
 transcript_client = TranscriptClient()
+transcript_broadcaster = TranscriptBroadcaster(transcript_client)
+
+
+def _build_sse_frame(payload: bytes) -> bytes:
+    """Wrap an already-serialized JSON payload as a Server-Sent Events frame"""
+    return b"data: " + payload + b"\n\n"
+
+
+def _build_transcript_frame(
+    timestamp: bytes,
+    utterances_json: bytes,
+    count: int,
+    stats: Dict[str, Any],
+    chunk_number: Optional[int] = None,
+    progress: Optional[Dict[str, Any]] = None
+) -> bytes:
+    """
+    Build the SSE frame for a chunk of pre-serialized utterances.
+
+    Only the small envelope fields are encoded here; the utterance array,
+    which makes up nearly all of the frame, is spliced in unchanged.
+    """
+    payload = b'{"timestamp": "' + timestamp + b'"'
+    if chunk_number is not None:
+        payload += b', "chunk_number": ' + str(chunk_number).encode()
+    payload += (
+        b', "chunk_size": ' + str(count).encode()
+        + b', "utterances": ' + utterances_json
+        + b', "stats": ' + orjson.dumps(stats)
+    )
+    if progress is not None:
+        payload += b', "progress": ' + orjson.dumps(progress)
+    return _build_sse_frame(payload + b"}")
+
+
+# Constant end-of-stream event, serialized once at import
+SSE_COMPLETE_FRAME = _build_sse_frame(orjson.dumps({'status': 'complete'}))
+
+
+# Keep browsers and reverse proxies (nginx, the Databricks Apps gateway) from caching or buffering events
+SSE_HEADERS = {
+    "Cache-Control": "no-cache",
+    "X-Accel-Buffering": "no",
+}
+
+
+def _sse_response(frames) -> StreamingResponse:
+    """Stream pre-built SSE frames to the client without proxy buffering"""
+    return StreamingResponse(frames, media_type="text/event-stream", headers=SSE_HEADERS)
 
 
 # ============================================================================
@@ -430,12 +742,9 @@ async def root():
 async def opensky_status():
     """Get OpenSky data source status"""
     try:
-        opensky_client._handle_rate_limit()
-        response = opensky_client.session.get(
-            "https://opensky-network.org/api/states/all",
-            timeout=5
-        )
-        available = response.status_code == 200
+        await opensky_client.rate_limiter.acquire()
+        # The probe blocks on the network; keep it off the event loop
+        available = await asyncio.to_thread(opensky_client.is_available)
         return DataSourceStatus(
             name="opensky",
             available=available,
@@ -464,8 +773,9 @@ async def get_flights(
     """
     try:
         region_name = region.value if region else "NORTH_AMERICA"
-        flights = opensky_client.get_flights(region=region_name)
-        return flights[:limit]
+        flights = await opensky_client.get_flights_cached(region=region_name)
+        # Records are built by OpenSkyClient already in FlightRecord shape; skip per-field re-validation
+        return Response(content=orjson.dumps(flights[:limit]), media_type="application/json")
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -482,12 +792,12 @@ async def stream_flights(
     Note: OpenSky API requires minimum 5 seconds between requests.
     """
     async def event_generator():
-        start_time = datetime.now()
+        start_time = time.monotonic()
         region_name = region.value if region else "NORTH_AMERICA"
 
-        while (datetime.now() - start_time).total_seconds() < duration:
+        while time.monotonic() - start_time < duration:
             try:
-                flights = opensky_client.get_flights(region=region_name)
+                flights = await opensky_client.get_flights_cached(region=region_name)
 
                 data = {
                     "timestamp": datetime.now(timezone.utc).isoformat(),
@@ -495,23 +805,20 @@ async def stream_flights(
                     "flights": flights
                 }
 
-                yield f"data: {json.dumps(data, default=str)}\n\n"
+                yield _build_sse_frame(orjson.dumps(data))
 
             except Exception as e:
                 error_data = {
                     "error": str(e),
                     "timestamp": datetime.now(timezone.utc).isoformat()
                 }
-                yield f"data: {json.dumps(error_data)}\n\n"
+                yield _build_sse_frame(orjson.dumps(error_data))
 
             await asyncio.sleep(interval)
 
-        yield f"data: {json.dumps({'status': 'complete'})}\n\n"
+        yield SSE_COMPLETE_FRAME
 
-    return StreamingResponse(
-        event_generator(),
-        media_type="text/event-stream"
-    )
+    return _sse_response(event_generator())
 
 
 # ============================================================================
@@ -525,20 +832,25 @@ async def transcript_status():
         name="transcript",
         available=True,
         message="Transcript data source is available",
-        records_available=len(transcript_client.conversations)
+        records_available=transcript_client.total_utterances
     )
 
 
 @app.get("/transcript/utterances", response_model=List[TranscriptUtterance], tags=["Transcript"])
 async def get_utterances(
-    limit: int = Query(10, ge=1, le=100, description="Number of utterances to return")
+    limit: int = Query(10, ge=1, le=10000, description="Number of utterances to return"),
+    offset: Optional[int] = Query(None, ge=0, description="Read from this absolute position instead of the shared cursor")
 ):
     """
     Get next batch of utterances from transcript dataset.
+
+    With an offset, the batch is read from that position in the looped dataset and the
+    shared cursor is left alone, so repeating a request returns the same utterances.
     """
     try:
-        utterances = transcript_client.get_utterances(limit=limit)
-        return utterances
+        # Serve the pre-serialized batch as-is instead of validating each utterance into a model
+        utterances_json, _ = transcript_client.get_utterances_json(limit=limit, offset=offset)
+        return Response(content=utterances_json, media_type="application/json")
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -564,17 +876,14 @@ async def stream_transcripts(
                     "progress": f"{count + 1}/{max_utterances}"
                 }
 
-                yield f"data: {json.dumps(data, default=str)}\n\n"
+                yield _build_sse_frame(orjson.dumps(data))
                 count += 1
 
             await asyncio.sleep(utterance_delay)
 
-        yield f"data: {json.dumps({'status': 'complete', 'total': count})}\n\n"
+        yield _build_sse_frame(orjson.dumps({'status': 'complete', 'total': count}))
 
-    return StreamingResponse(
-        event_generator(),
-        media_type="text/event-stream"
-    )
+    return _sse_response(event_generator())
 
 
 @app.get("/transcript/stream/high-throughput", tags=["Transcript"])
@@ -595,7 +904,7 @@ async def stream_transcripts_high_throughput(
     """
     async def event_generator():
         sent = 0
-        start_time = datetime.now()
+        start_time = time.monotonic()
         infinite_mode = (total_utterances == 0)
 
         while infinite_mode or sent < total_utterances:
@@ -605,40 +914,41 @@ async def stream_transcripts_high_throughput(
                 remaining = total_utterances - sent
                 current_chunk_size = min(chunk_size, remaining)
 
-            utterances = transcript_client.get_utterances(limit=current_chunk_size)
+            # Utterances stay pre-serialized; only the envelope around them is encoded per chunk,
+            # and the envelope and every utterance share one timestamp
+            timestamp = datetime.now(timezone.utc).isoformat().encode()
+            utterances_json, count = await transcript_client.get_utterances_chunk_async(
+                chunk_size=current_chunk_size, timestamp=timestamp
+            )
 
-            if utterances:
-                elapsed = (datetime.now() - start_time).total_seconds()
+            if count:
+                elapsed = time.monotonic() - start_time
                 current_throughput = sent / elapsed if elapsed > 0 else 0
 
-                data = {
-                    "timestamp": datetime.now(timezone.utc).isoformat(),
-                    "chunk_size": len(utterances),
-                    "utterances": utterances,
-                    "stats": {
-                        "total_sent": sent + len(utterances),
-                        "elapsed_seconds": round(elapsed, 2),
-                        "throughput": round(current_throughput, 2)
-                    }
+                stats = {
+                    "total_sent": sent + count,
+                    "elapsed_seconds": round(elapsed, 2),
+                    "throughput": round(current_throughput, 2)
                 }
 
+                progress = None
                 if not infinite_mode:
-                    data["progress"] = {
-                        "sent": sent + len(utterances),
+                    progress = {
+                        "sent": sent + count,
                         "total": total_utterances,
-                        "percent": round((sent + len(utterances)) / total_utterances * 100, 2)
+                        "percent": round((sent + count) / total_utterances * 100, 2)
                     }
 
-                yield f"data: {json.dumps(data, default=str)}\n\n"
-                sent += len(utterances)
+                yield _build_transcript_frame(timestamp, utterances_json, count, stats, progress=progress)
+                sent += count
 
-            if chunk_delay > 0:
-                await asyncio.sleep(chunk_delay)
+            # Always yield to the event loop, even with chunk_delay=0, so the transport can flush
+            await asyncio.sleep(chunk_delay)
 
         # Only send completion message if not in infinite mode
 
         if not infinite_mode:
-            elapsed = (datetime.now() - start_time).total_seconds()
+            elapsed = time.monotonic() - start_time
             throughput = sent / elapsed if elapsed > 0 else 0
 
             payload = {
@@ -649,12 +959,9 @@ async def stream_transcripts_high_throughput(
                 "throughput_description": f"{round(throughput, 0)} utterances/second"
             }
 
-            yield "data: " + json.dumps(payload) + "\n\n"
+            yield _build_sse_frame(orjson.dumps(payload))
 
-    return StreamingResponse(
-        event_generator(),
-        media_type="text/event-stream"
-    )
+    return _sse_response(event_generator())
 
 
 @app.get("/transcript/stream/continuous", tags=["Transcript"])
@@ -672,40 +979,40 @@ async def stream_transcripts_continuous(
     """
     async def event_generator():
         sent = 0
-        start_time = datetime.now()
+        dropped_total = 0
+        start_time = time.monotonic()
         chunk_count = 0
 
-        while True:
-            utterances = transcript_client.get_utterances(limit=chunk_size)
+        # Clients asking for the same chunking share one producer; only the stats are per client
+        async with transcript_broadcaster.subscribe(chunk_size, chunk_delay) as receive:
+            while True:
+                chunk = await receive()
+                if isinstance(chunk, Exception):
+                    error_data = {
+                        "error": str(chunk),
+                        "timestamp": datetime.now(timezone.utc).isoformat()
+                    }
+                    yield _build_sse_frame(orjson.dumps(error_data))
+                    return
+                timestamp, utterances_json, count, dropped = chunk
 
-            if utterances:
                 chunk_count += 1
-                sent += len(utterances)
-                elapsed = (datetime.now() - start_time).total_seconds()
+                sent += count
+                dropped_total += dropped
+                elapsed = time.monotonic() - start_time
                 current_throughput = sent / elapsed if elapsed > 0 else 0
 
-                data = {
-                    "timestamp": datetime.now(timezone.utc).isoformat(),
-                    "chunk_number": chunk_count,
-                    "chunk_size": len(utterances),
-                    "utterances": utterances,
-                    "stats": {
-                        "total_sent": sent,
-                        "elapsed_seconds": round(elapsed, 2),
-                        "throughput": round(current_throughput, 2),
-                        "throughput_description": f"{round(current_throughput, 0)} utterances/second"
-                    }
+                stats = {
+                    "total_sent": sent,
+                    "dropped": dropped_total,  # Utterances skipped while this client lagged behind the others
+                    "elapsed_seconds": round(elapsed, 2),
+                    "throughput": round(current_throughput, 2),
+                    "throughput_description": f"{round(current_throughput, 0)} utterances/second"
                 }
 
-                yield f"data: {json.dumps(data, default=str)}\n\n"
-
-            if chunk_delay > 0:
-                await asyncio.sleep(chunk_delay)
+                yield _build_transcript_frame(timestamp, utterances_json, count, stats, chunk_number=chunk_count)
 
-    return StreamingResponse(
-        event_generator(),
-        media_type="text/event-stream"
-    )
+    return _sse_response(event_generator())
 
 
 # ============================================================================
@@ -6,11 +6,20 @@ Run after starting the server:
 """
 
 import requests
-import json
+import orjson
 import time
 from datetime import datetime
 
 BASE_URL = "http://localhost:8000"
+SSE_READ_CHUNK_SIZE = 64 * 1024  # SSE frames can be several KB; read them in few large socket reads
+
+# One keep-alive connection shared by every test instead of a new connection per request
+session = requests.Session()
+
+
+def format_json(obj):
+    """Pretty-print a JSON value with two-space indentation"""
+    return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
 
 
 def print_section(title):
@@ -24,9 +33,9 @@ def test_root():
     """Test root endpoint"""
     print_section("Testing Root Endpoint")
 
-    response = requests.get(f"{BASE_URL}/")
+    response = session.get(f"{BASE_URL}/")
     print(f"Status: {response.status_code}")
-    print(f"Response: {json.dumps(response.json(), indent=2)}")
+    print(f"Response: {format_json(response.json())}")
 
     return response.status_code == 200
 
@@ -35,9 +44,9 @@ def test_health():
     """Test health check"""
     print_section("Testing Health Check")
 
-    response = requests.get(f"{BASE_URL}/health")
+    response = session.get(f"{BASE_URL}/health")
     print(f"Status: {response.status_code}")
-    print(f"Response: {json.dumps(response.json(), indent=2)}")
+    print(f"Response: {format_json(response.json())}")
 
     return response.status_code == 200
 
@@ -46,9 +55,9 @@ def test_opensky_status():
     """Test OpenSky status"""
     print_section("Testing OpenSky Status")
 
-    response = requests.get(f"{BASE_URL}/opensky/status")
+    response = session.get(f"{BASE_URL}/opensky/status")
     print(f"Status: {response.status_code}")
-    print(f"Response: {json.dumps(response.json(), indent=2)}")
+    print(f"Response: {format_json(response.json())}")
 
     return response.status_code == 200
 
@@ -57,7 +66,7 @@ def test_opensky_flights():
     """Test OpenSky flights endpoint"""
     print_section("Testing OpenSky Flights")
 
-    response = requests.get(f"{BASE_URL}/opensky/flights", params={"limit": 3})
+    response = session.get(f"{BASE_URL}/opensky/flights", params={"limit": 3})
     print(f"Status: {response.status_code}")
 
     if response.status_code == 200:
@@ -66,7 +75,7 @@ def test_opensky_flights():
 
         if flights:
             print(f"\nSample flight:")
-            print(json.dumps(flights[0], indent=2))
+            print(format_json(flights[0]))
 
     return response.status_code == 200
 
@@ -75,9 +84,9 @@ def test_transcript_status():
     """Test Transcript status"""
     print_section("Testing Transcript Status")
 
-    response = requests.get(f"{BASE_URL}/transcript/status")
+    response = session.get(f"{BASE_URL}/transcript/status")
     print(f"Status: {response.status_code}")
-    print(f"Response: {json.dumps(response.json(), indent=2)}")
+    print(f"Response: {format_json(response.json())}")
 
     return response.status_code == 200
 
@@ -86,7 +95,7 @@ def test_transcript_utterances():
     """Test Transcript utterances endpoint"""
     print_section("Testing Transcript Utterances")
 
-    response = requests.get(f"{BASE_URL}/transcript/utterances", params={"limit": 3})
+    response = session.get(f"{BASE_URL}/transcript/utterances", params={"limit": 3})
     print(f"Status: {response.status_code}")
 
     if response.status_code == 200:
@@ -95,7 +104,7 @@ def test_transcript_utterances():
 
         if utterances:
             print(f"\nSample utterance:")
-            print(json.dumps(utterances[0], indent=2))
+            print(format_json(utterances[0]))
 
     return response.status_code == 200
 
@@ -105,7 +114,7 @@ def test_transcript_conversation():
     print_section("Testing Transcript Conversation")
 
     conversation_id = "conv_00000"
-    response = requests.get(f"{BASE_URL}/transcript/conversation/{conversation_id}")
+    response = session.get(f"{BASE_URL}/transcript/conversation/{conversation_id}")
     print(f"Status: {response.status_code}")
 
     if response.status_code == 200:
@@ -125,16 +134,16 @@ def test_analytics():
     print_section("Testing Analytics Endpoints")
 
     # Speaker distribution
-    response = requests.get(f"{BASE_URL}/transcript/analytics/speaker-distribution")
+    response = session.get(f"{BASE_URL}/transcript/analytics/speaker-distribution")
     print(f"Speaker Distribution Status: {response.status_code}")
     if response.status_code == 200:
-        print(f"Response: {json.dumps(response.json(), indent=2)}")
+        print(f"Response: {format_json(response.json())}")
 
     # Domain distribution
-    response = requests.get(f"{BASE_URL}/transcript/analytics/domain-distribution")
+    response = session.get(f"{BASE_URL}/transcript/analytics/domain-distribution")
     print(f"\nDomain Distribution Status: {response.status_code}")
     if response.status_code == 200:
-        print(f"Response: {json.dumps(response.json(), indent=2)}")
+        print(f"Response: {format_json(response.json())}")
 
     return response.status_code == 200
 
@@ -144,7 +153,7 @@ def test_opensky_stream():
     print_section("Testing OpenSky Stream (5 seconds)")
 
     try:
-        with requests.get(
+        with session.get(
             f"{BASE_URL}/opensky/stream",
             params={"duration": 5, "interval": 1},
             stream=True,
@@ -156,9 +165,9 @@ def test_opensky_stream():
                 print("Receiving stream...")
                 count = 0
 
-                for line in response.iter_lines():
+                for line in response.iter_lines(chunk_size=SSE_READ_CHUNK_SIZE, delimiter=b"\n"):
                     if line and line.startswith(b"data: "):
-                        data = json.loads(line[6:])
+                        data = orjson.loads(line[6:])
                         count += 1
 
                         if "status" in data and data["status"] == "complete":
@@ -178,7 +187,7 @@ def test_transcript_stream():
     print_section("Testing Transcript Stream (5 utterances)")
 
     try:
-        with requests.get(
+        with session.get(
             f"{BASE_URL}/transcript/stream",
             params={"max_utterances": 5, "utterance_delay": 0.2},
             stream=True,
@@ -190,9 +199,9 @@ def test_transcript_stream():
                 print("Receiving stream...")
                 count = 0
 
-                for line in response.iter_lines():
+                for line in response.iter_lines(chunk_size=SSE_READ_CHUNK_SIZE, delimiter=b"\n"):
                     if line and line.startswith(b"data: "):
-                        data = json.loads(line[6:])
+                        data = orjson.loads(line[6:])
                         count += 1
 
                         if "status" in data and data["status"] == "complete":
@@ -218,7 +227,7 @@ def main():
 
     # Check if server is running
     try:
-        requests.get(f"{BASE_URL}/health", timeout=2)
+        session.get(f"{BASE_URL}/health", timeout=2)
     except requests.exceptions.ConnectionError:
         print("\n❌ ERROR: Cannot connect to the API server")
         print("Please start the server first:")
@@ -0,0 +1,95 @@
+"""
+Test the shared transcript producer behind /transcript/stream/continuous
+Runs in-process against TranscriptBroadcaster, no server needed
+"""
+
+import asyncio
+from main import TranscriptBroadcaster
+
+
+class CountingTranscriptClient:
+    """Chunk source that records how many chunks the producer has read"""
+
+    def __init__(self):
+        self.chunks_read = 0
+
+    async def get_utterances_chunk_async(self, chunk_size=1000, timestamp=None):
+        self.chunks_read += 1
+        return b"[]", chunk_size
+
+
+class FailingTranscriptClient:
+    """Chunk source that serves a few chunks and then raises"""
+
+    def __init__(self, chunks_before_failure=2):
+        self.chunks_before_failure = chunks_before_failure
+
+    async def get_utterances_chunk_async(self, chunk_size=1000, timestamp=None):
+        if self.chunks_before_failure == 0:
+            raise RuntimeError("dataset unavailable")
+        self.chunks_before_failure -= 1
+        return b"[]", chunk_size
+
+
+def test_producer_error_ends_subscriptions():
+    """Subscribers receive the producer's exception instead of blocking forever"""
+    async def run():
+        broadcaster = TranscriptBroadcaster(FailingTranscriptClient())
+        async with broadcaster.subscribe(10, 0.0) as first, broadcaster.subscribe(10, 0.0) as second:
+            for receive in (first, second):
+                items = []
+                while not items or not isinstance(items[-1], Exception):
+                    items.append(await asyncio.wait_for(receive(), timeout=5))
+
+                assert len(items) == 3
+                assert str(items[-1]) == "dataset unavailable"
+
+        # The failed producer is cleaned up so the next subscriber starts a fresh one
+        assert not broadcaster._producers
+        assert not broadcaster._subscribers
+
+    asyncio.run(run())
+    print("Producer error reached every subscriber")
+
+
+def test_slow_subscriber_paces_producer():
+    """A lone slow subscriber holds the producer back instead of having chunks thrown away"""
+    async def run():
+        client = CountingTranscriptClient()
+        broadcaster = TranscriptBroadcaster(client)
+        async with broadcaster.subscribe(1000, 0.0) as receive:
+            for _ in range(5):
+                await asyncio.sleep(0.05)
+                _, _, count, dropped = await asyncio.wait_for(receive(), timeout=5)
+                assert count == 1000
+                assert dropped == 0
+
+            # One chunk per read on top of a full queue, plus at most one waiting to be offered
+            assert client.chunks_read <= TranscriptBroadcaster.QUEUE_SIZE + 5 + 1
+
+    asyncio.run(run())
+    print("Slow subscriber paced the producer")
+
+
+def test_lagging_subscriber_reports_dropped():
+    """A subscriber that falls behind a faster one is told how many utterances it skipped"""
+    async def run():
+        broadcaster = TranscriptBroadcaster(CountingTranscriptClient())
+        async with broadcaster.subscribe(10, 0.0) as slow:
+            async with broadcaster.subscribe(10, 0.0) as fast:
+                for _ in range(TranscriptBroadcaster.QUEUE_SIZE * 3):
+                    await asyncio.wait_for(fast(), timeout=5)
+
+            # The slow queue filled up first; the chunk after it reports the gap
+            chunks = [await asyncio.wait_for(slow(), timeout=5) for _ in range(TranscriptBroadcaster.QUEUE_SIZE + 1)]
+            assert all(chunk[3] == 0 for chunk in chunks[:-1])
+            assert chunks[-1][3] > 0 and chunks[-1][3] % 10 == 0
+
+    asyncio.run(run())
+    print("Lagging subscriber saw its dropped count")
+
+
+if __name__ == "__main__":
+    test_producer_error_ends_subscriptions()
+    test_slow_subscriber_paces_producer()
+    test_lagging_subscriber_reports_dropped()
@@ -18,12 +18,9 @@ def test_throughput(total_utterances=10000, chunk_size=1000):
     retrieved = 0
     start_time = time.time()
 
-    while retrieved < total_utterances:
-        remaining = total_utterances - retrieved
-        current_chunk = min(chunk_size, remaining)
-
-        utterances = transcript_client.get_utterances(limit=current_chunk)
-        retrieved += len(utterances)
+    # Walk the dataset as pre-serialized chunks, the same form the streaming endpoints send
+    for _, count in transcript_client.iter_utterances(total_utterances, chunk_size=chunk_size):
+        retrieved += count
 
         if retrieved % 10000 == 0 or retrieved == total_utterances:
             elapsed = time.time() - start_time
@@ -0,0 +1,56 @@
+"""
+Test offset reads on the transcript client behind /transcript/utterances?offset=
+Runs in-process against TranscriptClient, no server needed
+"""
+
+import orjson
+from main import TranscriptClient
+
+
+def _records(utterances_json):
+    """Decode a batch, dropping the per-call timestamp so batches can be compared"""
+    return [{k: v for k, v in utt.items() if k != "timestamp"} for utt in orjson.loads(utterances_json)]
+
+
+def test_offset_reads_are_repeatable():
+    """The same offset returns the same utterances and leaves the shared cursor alone"""
+    client = TranscriptClient()
+    client.current_idx = 3
+    limit = min(50, client.total_utterances)
+
+    first, count = client.get_utterances_json(limit=limit, offset=7)
+    second, _ = client.get_utterances_json(limit=limit, offset=7)
+
+    assert count == limit
+    assert _records(first) == _records(second)
+    assert client.current_idx == 3
+
+    print(f"Offset reads repeat ({count} utterances)")
+
+
+def test_offset_reads_wrap_around():
+    """Offsets past the end wrap to the start of the dataset, like the shared cursor does"""
+    client = TranscriptClient()
+    total = client.total_utterances
+    limit = min(10, total)
+
+    # A batch that starts near the end continues from the first utterance
+    wrapped, count = client.get_utterances_json(limit=limit, offset=total - 2)
+    tail, _ = client.get_utterances_json(limit=2, offset=total - 2)
+    head, _ = client.get_utterances_json(limit=limit - 2, offset=0)
+    assert count == limit
+    assert _records(wrapped) == _records(tail) + _records(head)
+
+    # Offsets are taken modulo the dataset size
+    later, _ = client.get_utterances_json(limit=limit, offset=total * 3 + 5)
+    earlier, _ = client.get_utterances_json(limit=limit, offset=5)
+    assert _records(later) == _records(earlier)
+
+    assert client.current_idx == 0
+
+    print(f"Offset reads wrap around the {total:,}-utterance dataset")
+
+
+if __name__ == "__main__":
+    test_offset_reads_are_repeatable()
+    test_offset_reads_wrap_around()
@@ -23,8 +23,8 @@ Usage Example:
     # With API configuration for high throughput
     df = spark.readStream.format("transcript") \\
         .option("api_base_url", "http://localhost:8000") \\
-        .option("batch_size", "100") \\
-        .option("request_delay", "0.01") \\
+        .option("batch_size", "1000") \\
+        .option("request_delay", "0") \\
         .load()
 
 Schema:
@@ -60,16 +60,38 @@ applicable terms of service and regulations.
 ================================================================================
 """
 
+import logging
 import time
+import orjson
 import requests
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime, timezone
-from typing import Dict, List, Tuple, Iterator
+from functools import lru_cache
+from operator import itemgetter
+from typing import Dict, List, Optional, Tuple, Iterator
+from requests.adapters import HTTPAdapter
+from requests.packages.urllib3.util.retry import Retry
 
 from pyspark.sql.datasource import SimpleDataSourceStreamReader, DataSource
 from pyspark.sql.types import *
 
 DS_NAME = "transcript"
 
+logger = logging.getLogger(__name__)
+
+TIMESTAMP_FIELD = itemgetter('timestamp')
+# Schema fields after timestamp, in schema order, pulled from an utterance in one call
+UTTERANCE_FIELDS = itemgetter(
+    'conversation_id', 'utterance_id', 'speaker', 'text', 'confidence',
+    'start_time', 'end_time', 'domain', 'topic', 'accent'
+)
+
+
+@lru_cache(maxsize=64)
+def _parse_timestamp(timestamp_str: str) -> datetime:
+    """Parse an ISO timestamp; a batch shares one timestamp, so this parses once per batch"""
+    return datetime.fromisoformat(timestamp_str.replace('Z', '+00:00'))
+
 
 class TranscriptStreamReader(SimpleDataSourceStreamReader):
     """
@@ -78,66 +100,169 @@ class TranscriptStreamReader(SimpleDataSourceStreamReader):
     """
 
     DEFAULT_API_URL = "http://localhost:8000"
-    DEFAULT_BATCH_SIZE = 100
-    DEFAULT_REQUEST_DELAY = 0.05
+    DEFAULT_BATCH_SIZE = 1000
+    DEFAULT_REQUEST_DELAY = 0.0
+    MIN_EFFICIENT_BATCH_SIZE = 200  # Below this, per-request overhead dominates throughput
     MAX_RETRIES = 3
+    RETRY_BACKOFF = 0.3
+    RETRY_STATUS_CODES = [500, 502, 503, 504]
+    POOL_MAXSIZE = 8
 
     def __init__(self, schema: StructType, options: Dict[str, str]):
         super().__init__()
         self.schema = schema
         self.options = options
+        self.session = self._create_session()
 
         # API configuration
         self.api_base_url = options.get('api_base_url', self.DEFAULT_API_URL).rstrip('/')
         self.batch_size = int(options.get('batch_size', self.DEFAULT_BATCH_SIZE))
         self.request_delay = float(options.get('request_delay', self.DEFAULT_REQUEST_DELAY))
+        if self.batch_size < self.MIN_EFFICIENT_BATCH_SIZE:
+            logger.warning("batch_size=%d is small; each request carries fixed HTTP and parsing overhead, "
+                           "so use at least %d for high throughput", self.batch_size, self.MIN_EFFICIENT_BATCH_SIZE)
+        # Every poll requests the same batch size, so only the offset is appended per request
+        self._utterances_url = f"{self.api_base_url}/transcript/utterances?limit={self.batch_size}"
 
         # State tracking
         self.total_utterances_sent = 0
         self.start_time = datetime.now(timezone.utc)
 
-        # Test API connectivity
-        self._test_api_connection()
+        # Earliest time the next API request may be sent when request_delay paces requests
+        self._next_request_time = 0.0
+
+        # The next batch is requested while the current one is converted to records; the
+        # worker is started on first use and is not pickled with the reader
+        self._prefetch_pool: Optional[ThreadPoolExecutor] = None
+        self._pending: Optional[Tuple[int, Future]] = None  # (offset, fetch of the batch at that offset)
+
+    def __getstate__(self) -> Dict:
+        """Pickle without the prefetch worker and its pending fetch, which hold threads and locks"""
+        state = self.__dict__.copy()
+        state['_prefetch_pool'] = None
+        state['_pending'] = None
+        return state
+
+    def _get_prefetch_pool(self) -> ThreadPoolExecutor:
+        """
+        Return the single-worker prefetch pool, starting it on first use.
+
+        A new worker first tests API connectivity; the probe runs ahead of the first
+        fetch and leaves a warm keep-alive connection for it.
+        """
+        if self._prefetch_pool is None:
+            self._prefetch_pool = ThreadPoolExecutor(max_workers=1)
+            self._prefetch_pool.submit(self._test_api_connection)
+        return self._prefetch_pool
+
+    def _create_session(self) -> requests.Session:
+        """
+        Create a keep-alive session with retry logic, reused for every poll.
+
+        The session pickles cleanly (its adapters drop their connection pools),
+        so the reader can still be shipped to executors.
+        """
+        session = requests.Session()
+        retry_strategy = Retry(
+            total=self.MAX_RETRIES,
+            backoff_factor=self.RETRY_BACKOFF,
+            status_forcelist=self.RETRY_STATUS_CODES
+        )
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.POOL_MAXSIZE, max_retries=retry_strategy)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
+
+    def _get(self, url: str, timeout: float) -> bytes:
+        """GET a URL through the session and return the raw body, raising on an HTTP error status"""
+        response = self.session.get(url, timeout=timeout)
+        response.raise_for_status()
+        return response.content
 
     def _test_api_connection(self):
         """Test connectivity to the API"""
-        session = requests.Session()
         try:
-            url = f"{self.api_base_url}/transcript/status"
-            response = session.get(url, timeout=5)
-            response.raise_for_status()
-            status = response.json()
-            print(f"Connected to transcript API: {status.get('message', 'OK')}")
-            print(f"Records available: {status.get('records_available', 'unknown')}")
+            status = orjson.loads(self._get(f"{self.api_base_url}/transcript/status", timeout=5))
+            logger.info("Connected to transcript API: %s", status.get('message', 'OK'))
+            logger.info("Records available: %s", status.get('records_available', 'unknown'))
         except Exception as e:
-            print(f"Warning: Could not connect to API at {self.api_base_url}: {e}")
-            print("Will attempt to fetch data anyway...")
-        finally:
-            session.close()
-
-    def _fetch_utterances(self, limit: int) -> List[Dict]:
-        """Fetch utterances from the API - the API loops through data automatically"""
-        url = f"{self.api_base_url}/transcript/utterances"
-        params = {'limit': limit}
-
-        for attempt in range(self.MAX_RETRIES):
-            try:
-                response = requests.get(url, params=params, timeout=10)
-                response.raise_for_status()
-                utterances = response.json()
-                return utterances
-            except requests.exceptions.RequestException as e:
-                if attempt < self.MAX_RETRIES - 1:
-                    print(f"API request failed (attempt {attempt + 1}/{self.MAX_RETRIES}): {e}")
-                    time.sleep(1)
-                else:
-                    print(f"Failed to fetch utterances after {self.MAX_RETRIES} attempts: {e}")
-                    return []
-
-        return []
+            logger.warning("Could not connect to API at %s: %s. Will attempt to fetch data anyway...",
+                           self.api_base_url, e)
+
+    def _fetch_utterances(self, offset: int, limit: Optional[int] = None) -> List[Dict]:
+        """
+        Fetch the batch of utterances at a stream offset - the API loops through data automatically.
+
+        The API reads from the requested position rather than its shared cursor, so
+        the same offset always returns the same utterances.
+        """
+        if limit is None:
+            url = f"{self._utterances_url}&offset={offset}"
+        else:
+            url = f"{self.api_base_url}/transcript/utterances?limit={limit}&offset={offset}"
+        # Retries with backoff are handled by the session's adapter
+        try:
+            utterances = orjson.loads(self._get(url, timeout=10))
+            return utterances
+        except (requests.exceptions.RequestException, orjson.JSONDecodeError) as e:
+            logger.error("Failed to fetch utterances after %d retries: %s", self.MAX_RETRIES, e)
+            return []
+
+    def _to_record(self, utt: Dict) -> Tuple:
+        """Build a schema tuple from an incomplete utterance, filling in defaults"""
+        # Parse timestamp from API response
+        timestamp_str = utt.get('timestamp')
+        if timestamp_str and isinstance(timestamp_str, str):
+            timestamp = _parse_timestamp(timestamp_str)
+        else:
+            timestamp = datetime.now(timezone.utc)
+
+        return (
+            timestamp,
+            utt.get('conversation_id', 'unknown'),
+            utt.get('utterance_id', 0),
+            utt.get('speaker', 'unknown'),
+            utt.get('text', ''),
+            utt.get('confidence', 1.0),
+            utt.get('start_time', 0.0),
+            utt.get('end_time', 0.0),
+            utt.get('domain'),
+            utt.get('topic'),
+            utt.get('accent')
+        )
+
+    def _fetch_next_batch(self, offset: int) -> List[Dict]:
+        """
+        Fetch the next batch on the prefetch worker, at most one request per request_delay.
+
+        Fetches run one at a time on the worker, so pacing here spaces the actual API
+        requests; time spent since the previous request counts toward the interval.
+        """
+        if self.request_delay > 0:
+            wait = self._next_request_time - time.monotonic()
+            if wait > 0:
+                time.sleep(wait)
+            self._next_request_time = time.monotonic() + self.request_delay
+        return self._fetch_utterances(offset)
+
+    def _to_records(self, utterances: List[Dict]) -> List[Tuple]:
+        """
+        Convert API utterances to Spark records, mapping the field getters over the whole batch;
+        if any record is incomplete, rebuild the batch with per-field defaults
+        """
+        try:
+            timestamps = map(_parse_timestamp, map(TIMESTAMP_FIELD, utterances))
+            return [
+                (timestamp,) + fields
+                for timestamp, fields in zip(timestamps, map(UTTERANCE_FIELDS, utterances))
+            ]
+        except (KeyError, AttributeError, ValueError):
+            return [self._to_record(utt) for utt in utterances]
 
     def initialOffset(self) -> Dict[str, int]:
         """Initialize offset for streaming"""
+        # Start the worker now so the connectivity probe overlaps query startup
+        self._get_prefetch_pool()
         return {
             'total_sent': 0
         }
@@ -150,47 +275,21 @@ class TranscriptStreamReader(SimpleDataSourceStreamReader):
         # Restore state from offset
         self.total_utterances_sent = start.get('total_sent', 0)
 
-        # Add delay between requests if configured
-        if self.request_delay > 0:
-            time.sleep(self.request_delay)
-
-        # Fetch utterances from API
-        utterances = self._fetch_utterances(self.batch_size)
+        # Take the prefetched batch (fetching now on the first read, or if Spark asked for a
+        # different offset), then request the next one so its round trip overlaps converting this batch
+        prefetch_pool = self._get_prefetch_pool()
+        offset = self.total_utterances_sent
+        if self._pending is None or self._pending[0] != offset:
+            self._pending = (offset, prefetch_pool.submit(self._fetch_next_batch, offset))
+        utterances = self._pending[1].result()
+        next_offset = offset + len(utterances)
+        self._pending = (next_offset, prefetch_pool.submit(self._fetch_next_batch, next_offset))
 
         if not utterances:
             # Return empty batch but keep offset
             return ([], start)
 
-        # Convert API response to Spark records
-        batch = []
-        for utt in utterances:
-            # Parse timestamp from API response
-            timestamp_str = utt.get('timestamp')
-            if timestamp_str:
-                # Handle ISO format timestamp
-                if isinstance(timestamp_str, str):
-                    timestamp = datetime.fromisoformat(timestamp_str.replace('Z', '+00:00'))
-                else:
-                    timestamp = datetime.now(timezone.utc)
-            else:
-                timestamp = datetime.now(timezone.utc)
-
-            # Create tuple matching schema
-            record = (
-                timestamp,
-                utt.get('conversation_id', 'unknown'),
-                utt.get('utterance_id', 0),
-                utt.get('speaker', 'unknown'),
-                utt.get('text', ''),
-                utt.get('confidence', 1.0),
-                utt.get('start_time', 0.0),
-                utt.get('end_time', 0.0),
-                utt.get('domain'),
-                utt.get('topic'),
-                utt.get('accent')
-            )
-
-            batch.append(record)
+        batch = self._to_records(utterances)
 
         # Update offset
         new_offset = {
@@ -200,14 +299,36 @@ class TranscriptStreamReader(SimpleDataSourceStreamReader):
         self.total_utterances_sent += len(batch)
 
         if batch:
-            print(f"Fetched batch: {len(batch)} utterances (total: {self.total_utterances_sent})")
+            logger.info("Fetched batch: %d utterances (total: %d)", len(batch), self.total_utterances_sent)
 
         return (batch, new_offset)
 
     def readBetweenOffsets(self, start: Dict[str, int], end: Dict[str, int]) -> Iterator[Tuple]:
-        """Read utterances between offsets"""
-        data, _ = self.read(start)
-        return iter(data)
+        """
+        Re-read the utterances between two offsets, e.g. when Spark replays a micro-batch.
+
+        Offsets are positions in the looped dataset, so the replay fetches the same
+        utterances the original read returned (stamped with a fresh ingest timestamp),
+        without read()'s pacing and without touching the prefetched batch.
+        """
+        position = start.get('total_sent', 0)
+        end_position = end.get('total_sent', 0)
+        records: List[Tuple] = []
+        while position < end_position:
+            utterances = self._fetch_utterances(position, min(end_position - position, self.batch_size))
+            if not utterances:
+                break
+            records.extend(self._to_records(utterances))
+            position += len(utterances)
+        return iter(records)
+
+    def stop(self):
+        """Shut down the prefetch worker and close the session when the query stops"""
+        if self._prefetch_pool is not None:
+            self._prefetch_pool.shutdown(wait=False, cancel_futures=True)
+            self._prefetch_pool = None
+            self._pending = None
+        self.session.close()
 
 
 class TranscriptDataSource(DataSource):
@@ -220,8 +341,9 @@ class TranscriptDataSource(DataSource):
 
     Options:
         - api_base_url: Base URL of the transcript API (default: http://localhost:8000)
-        - batch_size: Number of utterances to fetch per request (default: 100)
-        - request_delay: Delay between API requests in seconds (default: 0.05)
+        - batch_size: Number of utterances to fetch per request (default: 1000)
+        - request_delay: Minimum interval between API requests in seconds (default: 0; the
+          pipeline trigger interval already paces micro-batches)
 
     Example:
         # Basic streaming
@@ -230,8 +352,8 @@ class TranscriptDataSource(DataSource):
         # High throughput configuration
         df = spark.readStream.format("transcript") \\
             .option("api_base_url", "http://localhost:8000") \\
-            .option("batch_size", "200") \\
-            .option("request_delay", "0.01") \\
+            .option("batch_size", "2000") \\
+            .option("request_delay", "0") \\
             .load()
     """
 
@@ -7,11 +7,9 @@ spark.dataSource.register(TranscriptDataSource)
 
 
 # Configuration for transcript streaming
-DATASET = "AIxBlock/92k-real-world-call-center-scripts-english"
-UTTERANCE_DELAY = 0.1  # seconds between utterances (simulate real-time)
-CONVERSATION_DELAY = 2.0  # seconds between conversations
-LOOP_CONTINUOUSLY = True  # keep streaming indefinitely
-MAX_UTTERANCES = -1  # unlimited, set to positive number to limit
+API_BASE_URL = "http://localhost:8000"  # transcript API (api/main.py); it loops over its dataset indefinitely
+BATCH_SIZE = 1000  # utterances per request; larger batches amortize per-request and per-micro-batch overhead
+REQUEST_DELAY = 0.0  # minimum seconds between requests; the trigger interval already paces micro-batches
 
 
 @dp.table
@@ -19,9 +17,9 @@ def ingest_transcripts():
     """
     Ingest real-time call center transcripts.
 
-    This transformation streams call center conversations utterance by utterance,
-    simulating a real-time transcription pipeline. The data source loads conversations
-    from HuggingFace and chunks them into individual utterances.
+    This transformation streams call center utterances in batches from the transcript
+    API, simulating a real-time transcription pipeline. Each micro-batch holds up to
+    BATCH_SIZE utterances.
 
     Schema:
         - timestamp: When the utterance was ingested
@@ -39,11 +37,9 @@ def ingest_transcripts():
     return (
         spark.readStream
         .format("transcript")
-        .option("dataset", DATASET)
-        .option("utterance_delay", str(UTTERANCE_DELAY))
-        .option("conversation_delay", str(CONVERSATION_DELAY))
-        .option("loop", "true" if LOOP_CONTINUOUSLY else "false")
-        .option("max_utterances", str(MAX_UTTERANCES))
+        .option("api_base_url", API_BASE_URL)
+        .option("batch_size", str(BATCH_SIZE))
+        .option("request_delay", str(REQUEST_DELAY))
         .load()
     )
 
@@ -54,12 +50,12 @@ def transcript_by_speaker():
     Aggregate transcripts by speaker role.
 
     This shows the distribution of utterances between agents and customers.
+    Rows are unordered; sort by domain and speaker at query time.
     """
     return (
         dp.read("ingest_transcripts")
         .groupBy("speaker", "domain")
         .count()
-        .orderBy("domain", "speaker")
     )
 
 
@@ -69,6 +65,7 @@ def conversation_stats():
     Calculate statistics per conversation.
 
     Provides insights into conversation length, speaker balance, and confidence scores.
+    Rows are unordered; sort by conversation_start at query time.
     """
     from pyspark.sql import functions as F
 
@@ -77,12 +74,11 @@ def conversation_stats():
         .groupBy("conversation_id", "domain", "topic", "accent")
         .agg(
             F.count("*").alias("total_utterances"),
-            F.sum(F.when(F.col("speaker") == "agent", 1).otherwise(0)).alias("agent_utterances"),
-            F.sum(F.when(F.col("speaker") == "customer", 1).otherwise(0)).alias("customer_utterances"),
+            F.count(F.when(F.col("speaker") == "agent", True)).alias("agent_utterances"),
+            F.count(F.when(F.col("speaker") == "customer", True)).alias("customer_utterances"),
             F.avg("confidence").alias("avg_confidence"),
             F.max("end_time").alias("conversation_duration"),
             F.min("timestamp").alias("conversation_start"),
             F.max("timestamp").alias("conversation_end")
         )
-        .orderBy(F.col("conversation_start").desc())
     )